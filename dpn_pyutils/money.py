@@ -1,3 +1,17 @@
+import functools
+from typing import Any, Callable, Dict
+
+
+def _format_small(abs_value: float) -> str:
+    """
+    Formats a fractional value to at most 6 decimal places with trailing zeroes removed, e.g.
+    0.000690 -> "0.00069". Fixed-point formatting is used as python would otherwise format
+    values with lots of leading zeroes using scientific notation
+    """
+
+    return abs_value.__format__(".6f").rstrip("0")
+
+
 def format_currency_market_display_float(
     value: float, currency_symbol: str = "$", suffix: str = ""
 ) -> str:
@@ -16,72 +30,109 @@ def format_currency_market_display_float(
         Between $1,000,000 and $999,999,999 -> Show leading minus, currency symbol, 1 decimal places, and 'M' suffix
         >$1,000,000,000 -> show leading minus, currency symbol, 1 decimal place, and 'B' suffix
         >$1,000,000,000,000 -> show leading minus, currency symbol, 1 decimal place, and 'T' suffix
+
+    Formatted values are cached, as market prices tend to repeat on a fixed tick size
+    """
+
+    # Negative zero is normalised as it compares and hashes equal to zero, and would otherwise
+    # share a cache entry with it. Other values are passed through unchanged so that any real
+    # number type is formatted as it is given
+    if value == 0:
+        value = 0.0
+
+    return _format_currency_market_display_float(value, currency_symbol, suffix)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_currency_market_display_float(
+    value: float, currency_symbol: str, suffix: str
+) -> str:
+    """
+    Cached implementation of format_currency_market_display_float()
+    """
+
+    return make_currency_formatter(currency_symbol, suffix)(value)
+
+
+def format_currency_market_display_bytes(
+    value: float, currency_symbol: str = "$", suffix: str = ""
+) -> bytes:
+    """
+    Formats a value according to conventional market display as UTF-8 encoded bytes, for values
+    that are written straight into network payloads. Encoded values are cached so that repeated
+    prices are not encoded again on every send. See format_currency_market_display_float() for
+    the display conventions
+    """
+
+    if value == 0:
+        value = 0.0
+
+    return _format_currency_market_display_bytes(value, currency_symbol, suffix)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_currency_market_display_bytes(
+    value: float, currency_symbol: str, suffix: str
+) -> bytes:
+    """
+    Cached implementation of format_currency_market_display_bytes()
     """
 
-    value_opts = {
-        "negative_qty": False if value >= 0 else True,
-        "prefix": "",
-        "currency_symbol": currency_symbol,
-        "value": "",
-        "summary_suffix": "",
-        "suffix": suffix,
-    }
-
-    # Format Trillions
-    if abs(value) >= float(1e12):
-        chopped_value = value / 1e12
-        value_opts["value"] = "{:.1f}".format(abs(chopped_value))
-        value_opts["summary_suffix"] = "T"
-
-    # Format Billions
-    elif abs(value) >= float(1e9):
-        chopped_value = value / 1e9
-        value_opts["value"] = "{:.1f}".format(abs(chopped_value))
-        value_opts["summary_suffix"] = "B"
-
-    # Format Millions
-    elif abs(value) >= float(1e6):
-        chopped_value = value / float(1e6)
-        value_opts["value"] = "{:.1f}".format(abs(chopped_value))
-        value_opts["summary_suffix"] = "M"
-
-    # Format Thousands
-    elif abs(value) >= float(1e3):
-        chopped_value = value / float(1e3)
-        value_opts["value"] = "{:.2f}".format(abs(chopped_value))
-        value_opts["summary_suffix"] = "k"
-
-    # Format Fractional
-    elif abs(value) > 0 and abs(value) < 1:
-        # If the fractional value is greater than 0.01
-        if abs(value) > float(1e-2):
-            value_opts["value"] = "{:.2f}".format(abs(value))
-
-        # If the fractional value is greater than 6 decimal places (i.e. >=0.000001)
-        elif abs(value) > float(1e-6):
-            # Due to python's formatting of values with lots of leading zeroes into scientific
-            # notation, we need to we need to truncate
-            value_opts["value"] = "{:.17f}".format(
-                float("{:.6f}".format(abs(value)))
-            ).rstrip("0")
-
-        # If the fractional value is less than 6 decimal places (i.e. <0.000001)
-        else:
-            value_opts["prefix"] = "<"
-            value_opts["value"] = "0.000001"
-
-    # Format small numbers
-    else:
-        value_opts["value"] = "{:.2f}".format(abs(value))
-
-    # Generate our formatted value
-    formatted_value = "{}{}{}{}{}{}".format(
-        value_opts["prefix"],
-        "-" if value_opts["negative_qty"] else "",
-        value_opts["currency_symbol"],
-        value_opts["value"],
-        value_opts["summary_suffix"],
-        value_opts["suffix"],
+    return _format_currency_market_display_float(value, currency_symbol, suffix).encode(
+        "utf-8"
     )
 
-    return formatted_value
+
+@functools.lru_cache(maxsize=64)
+def make_currency_formatter(
+    currency_symbol: str = "$", suffix: str = ""
+) -> Callable[[float], str]:
+    """
+    Creates a formatter that formats values according to the conventions of
+    format_currency_market_display_float() for a fixed currency symbol and suffix. The formatter is
+    generated with the symbol and suffix compiled in as string literals so that they are not
+    substituted on every call, and formatters are cached per (currency_symbol, suffix) pair.
+
+    E.g.
+        format_aud = make_currency_formatter("$", " AUD")
+        format_aud(1234.5) -> "$1.23k AUD"
+    """
+
+    # The sign and currency symbol are selected from precomputed literals, and each band's summary
+    # suffix is joined to the suffix ahead of time, so a value is formatted with a single
+    # float.__format__() call without going through str.format() parsing
+    signed_symbol = f"({'-' + currency_symbol!r} if negative else {currency_symbol!r})"
+
+    # Bands are selected by bisecting the thresholds so that the most common values, below 1,000,
+    # are formatted after two comparisons instead of falling through every larger band first.
+    # Only NaN fails every comparison and falls through to the final return
+    formatter_source = f"""
+def format_currency(value):
+    negative = value < 0
+    abs_value = abs(value)
+
+    if abs_value < 1e3:
+        if abs_value > 1e-2 or abs_value == 0:
+            return {signed_symbol} + abs_value.__format__(".2f") + {suffix!r}
+        if abs_value > 1e-6:
+            return {signed_symbol} + _format_small(abs_value) + {suffix!r}
+        if negative:
+            return {f"<-{currency_symbol}0.000001{suffix}"!r}
+        return {f"<{currency_symbol}0.000001{suffix}"!r}
+
+    if abs_value < 1e6:
+        return {signed_symbol} + (abs_value / 1e3).__format__(".2f") + {"k" + suffix!r}
+    if abs_value < 1e9:
+        return {signed_symbol} + (abs_value / 1e6).__format__(".1f") + {"M" + suffix!r}
+    if abs_value < 1e12:
+        return {signed_symbol} + (abs_value / 1e9).__format__(".1f") + {"B" + suffix!r}
+    if abs_value >= 1e12:
+        return {signed_symbol} + (abs_value / 1e12).__format__(".1f") + {"T" + suffix!r}
+
+    return {signed_symbol} + abs_value.__format__(".2f") + {suffix!r}
+"""
+
+    formatter_namespace: Dict[str, Any] = {"_format_small": _format_small}
+    exec(formatter_source, formatter_namespace)
+
+    return formatter_namespace["format_currency"]
@@ -2,8 +2,11 @@
 Defines timezone-aware periods
 """
 
+import functools
+import re
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, time, timedelta, tzinfo
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 import pytz
 from pytz.tzinfo import DstTzInfo, StaticTzInfo
@@ -11,6 +14,54 @@ from pytz.tzinfo import DstTzInfo, StaticTzInfo
 DATE_FORMAT = "%Y-%m-%d"
 TIME_FORMAT = "%H:%M:%S"
 
+# Days of the week where Sunday=0 ... Saturday=6 that a period schedule is valid for when none are
+# supplied. This replaces the PeriodSchedule.valid_days_of_week class attribute, which conflicts
+# with the slot of the same name
+DEFAULT_VALID_DAYS_OF_WEEK: Tuple[int, ...] = (0, 1, 2, 3, 4, 5, 6)
+
+# Matches times of day in TIME_FORMAT, with hours, minutes and seconds of one or two ASCII digits
+_TIME_OF_DAY_PATTERN = re.compile(r"([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2})")
+
+_ONE_DAY = timedelta(days=1)
+
+# Offsets of zero to seven days, indexed by the number of days between a date and a valid day
+_DAY_OFFSETS = tuple(timedelta(days=days) for days in range(8))
+
+
+def _parse_time_of_day(time_of_day: str) -> time:
+    """
+    Parses a string in the form of "HH:MM:SS" in 24-hour time into a time, equivalent to
+    datetime.strptime(time_of_day, TIME_FORMAT).time() without the overhead of strptime()
+    """
+
+    time_of_day_match = _TIME_OF_DAY_PATTERN.fullmatch(time_of_day)
+    if time_of_day_match is None:
+        raise ValueError(
+            f"Time of day '{time_of_day}' does not match format '{TIME_FORMAT}'"
+        )
+
+    hour, minute, second = time_of_day_match.groups()
+    return time(int(hour), int(minute), int(second))
+
+
+def _day_of_week(check_date: date) -> int:
+    """
+    Gets the day of the week of a date where Sunday=0 ... Saturday=6, equivalent to
+    int(check_date.strftime("%w")) without formatting the date
+    """
+
+    return check_date.isoweekday() % 7
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_tz(tz_name: str) -> tzinfo | DstTzInfo | StaticTzInfo:
+    """
+    Resolves a timezone name into a pytz timezone, reusing the timezone for names that have
+    already been resolved
+    """
+
+    return pytz.timezone(tz_name)
+
 
 class PeriodSchedule:
     """
@@ -18,13 +69,31 @@ class PeriodSchedule:
     end time as well as being timezone aware.
     """
 
+    __slots__ = (
+        "period_start_time_of_day",
+        "period_end_time_of_day",
+        "valid_days_of_week",
+        "_valid_days",
+        "_valid_days_mask",
+        "tz",
+        "_localize",
+        "start_time",
+        "end_time",
+        "_crosses_midnight",
+        "__weakref__",
+    )
+
     period_start_time_of_day: str
     period_end_time_of_day: str
-    valid_days_of_week: List[int] = [0, 1, 2, 3, 4, 5, 6]
+    valid_days_of_week: List[int]
+    _valid_days: Tuple[int, ...]
+    _valid_days_mask: int
     tz: tzinfo | DstTzInfo | StaticTzInfo
+    _localize: Callable[[datetime], datetime]
 
     start_time: time
     end_time: time
+    _crosses_midnight: bool
 
     def __repr__(self) -> str:
         return (
@@ -53,14 +122,15 @@ class PeriodSchedule:
         """
 
         # Ensure that supplied strings are valid
-        self.start_time = datetime.strptime(
-            period_start_time_of_day, TIME_FORMAT
-        ).time()
+        self.start_time = _parse_time_of_day(period_start_time_of_day)
         self.period_start_time_of_day = period_start_time_of_day
 
-        self.end_time = datetime.strptime(period_end_time_of_day, TIME_FORMAT).time()
+        self.end_time = _parse_time_of_day(period_end_time_of_day)
         self.period_end_time_of_day = period_end_time_of_day
 
+        # A period that ends before it starts runs overnight into the following day
+        self._crosses_midnight = self.end_time < self.start_time
+
         if valid_days_of_week is not None and len(valid_days_of_week) > 0:
             if len(valid_days_of_week) > 7:
                 raise ValueError(
@@ -69,6 +139,8 @@ class PeriodSchedule:
                     f"{valid_days_of_week}"
                 )
 
+            # Bit 0 (Sunday) through to bit 6 (Saturday) are set for each valid day
+            valid_days_mask = 0
             for vd in valid_days_of_week:
                 if vd < 0 or vd > 6:
                     raise ValueError(
@@ -76,12 +148,20 @@ class PeriodSchedule:
                         "be between 0 (Sunday) through to 6 (Saturday)."
                     )
 
+                valid_days_mask |= 1 << vd
+
             self.valid_days_of_week = valid_days_of_week
+            self._valid_days = tuple(sorted(set(valid_days_of_week)))
+            self._valid_days_mask = valid_days_mask
+        else:
+            self.valid_days_of_week = list(DEFAULT_VALID_DAYS_OF_WEEK)
+            self._valid_days = DEFAULT_VALID_DAYS_OF_WEEK
+            self._valid_days_mask = 0b1111111
 
         if tz is None:
-            self.tz = pytz.timezone("UTC")
+            self.tz = _resolve_tz("UTC")
         elif isinstance(tz, str):
-            self.tz = pytz.timezone(tz)
+            self.tz = _resolve_tz(tz)
         elif (
             isinstance(tz, tzinfo)
             or isinstance(tz, StaticTzInfo)
@@ -91,26 +171,71 @@ class PeriodSchedule:
         else:
             raise ValueError(f"Invalid timezone of type '{type(tz)}' supplied: {tz}")
 
+        # Bind how naive datetimes are localized once rather than checking on every call.
+        # Timezones without localize(), such as datetime.timezone, are attached directly
+        localize = getattr(self.tz, "localize", None)
+        if localize is None:
+            localize = functools.partial(datetime.replace, tzinfo=self.tz)
+
+        self._localize = localize
+
     def is_in_period(self, check_datetime: datetime) -> bool:
         """
         Checks if the supplied datetime is in the configured period
         """
 
         localized_dt = self.localize_check_datetime(check_datetime)
-        check_date, _ = self.extract_date_time_from_check_datetime(localized_dt)
-        if int(check_date.strftime("%w")) not in self.valid_days_of_week:
+
+        # Reject invalid days of the week before extracting the date and time of the period
+        if not self._valid_days_mask & (1 << _day_of_week(localized_dt)):
             return False
 
-        (
-            start_datetime,
-            end_datetime,
-        ) = self.get_start_end_datetimes_for_datetime(check_datetime)
+        check_date, check_time = self.extract_date_time_from_check_datetime(
+            localized_dt
+        )
+        start_datetime, end_datetime = self._get_start_end_datetimes(
+            check_date, check_time
+        )
 
         if start_datetime <= localized_dt and end_datetime > localized_dt:
             return True
 
         return False
 
+    def is_in_period_bulk(self, check_datetimes: Iterable[datetime]) -> List[bool]:
+        """
+        Checks if each of the supplied datetimes is in the configured period, reusing the start and
+        end datetimes of the period across check datetimes that fall on the same date
+        """
+
+        period_datetimes: Dict[Tuple[date, int], Tuple[datetime, datetime]] = {}
+        in_period = []
+
+        for check_datetime in check_datetimes:
+            localized_dt = self.localize_check_datetime(check_datetime)
+            if not self._valid_days_mask & (1 << _day_of_week(localized_dt)):
+                in_period.append(False)
+                continue
+
+            check_date, check_time = self.extract_date_time_from_check_datetime(
+                localized_dt
+            )
+
+            # The start and end datetimes only depend on the date and on which side of the end
+            # time the check time falls
+            end_side = (check_time > self.end_time) - (check_time < self.end_time)
+            start_end_datetimes = period_datetimes.get((check_date, end_side))
+            if start_end_datetimes is None:
+                start_end_datetimes = self._get_start_end_datetimes(
+                    check_date, check_time
+                )
+                period_datetimes[(check_date, end_side)] = start_end_datetimes
+
+            start_datetime, end_datetime = start_end_datetimes
+            in_period.append(start_datetime <= localized_dt < end_datetime)
+
+        return in_period
+
     def localize_check_datetime(self, check_datetime: datetime) -> datetime:
         """
         Checks if the supplied datetime is non-naive (i.e. has a timezone defined) and
@@ -124,14 +249,7 @@ class PeriodSchedule:
             raise ValueError("Cannot localize datetime timezone on None value")
 
         if check_datetime.tzinfo is None:
-            if not hasattr(self.tz, "localize"):
-                raise RuntimeError(
-                    f"Supplied timezone type ({type(self.tz)}) does not have a localize() method. "
-                    f"Unable to localize datetime {check_datetime}. Pick a different timezone for "
-                    "this period schedule."
-                )
-
-            return self.tz.localize(check_datetime)  # type: ignore
+            return self._localize(check_datetime)
         else:
             return check_datetime.astimezone(self.tz)
 
@@ -151,6 +269,61 @@ class PeriodSchedule:
 
         return (check_datetime.date(), check_datetime.time())
 
+    def _valid_day_offset(
+        self, check_date: date, direction: int, exclude_check_date: bool = False
+    ) -> int:
+        """
+        Gets the number of days from the check date to the closest valid day of the week, searching
+        forwards (direction=1) or backwards (direction=-1) from the check date. If the check date
+        is excluded, a check date on a valid day of the week resolves to the same day of the
+        following or previous week instead
+        """
+
+        check_day_of_week = _day_of_week(check_date)
+
+        # The valid days are sorted, so the closest valid day is found by bisecting them and
+        # wrapping around the end (or start) of the week
+        if direction > 0:
+            bisect_days = bisect_right if exclude_check_date else bisect_left
+            valid_day_index = bisect_days(self._valid_days, check_day_of_week)
+            valid_day = self._valid_days[valid_day_index % len(self._valid_days)]
+            offset = (valid_day - check_day_of_week) % 7
+        else:
+            bisect_days = bisect_left if exclude_check_date else bisect_right
+            valid_day_index = bisect_days(self._valid_days, check_day_of_week) - 1
+            valid_day = self._valid_days[valid_day_index]
+            offset = (check_day_of_week - valid_day) % 7
+
+        if exclude_check_date:
+            return offset or 7
+
+        return offset
+
+    def _duration(
+        self,
+        check_datetime: datetime,
+        get_period_datetime: Callable[[datetime], datetime | None],
+        description: str,
+        since: bool,
+    ) -> timedelta:
+        """
+        Gets the timedelta duration between the supplied check_datetime and the period datetime
+        returned by get_period_datetime, either since the period datetime or until it
+        """
+
+        localized_dt = self.localize_check_datetime(check_datetime)
+        period_datetime = get_period_datetime(localized_dt)
+
+        if period_datetime is None:
+            raise ValueError(
+                f"Cannot get duration {description} datetime as it is null"
+            )
+
+        if since:
+            return localized_dt - period_datetime
+
+        return period_datetime - localized_dt
+
     def get_start_end_datetimes_for_datetime(
         self, check_datetime: datetime
     ) -> Tuple[datetime, datetime]:
@@ -163,26 +336,36 @@ class PeriodSchedule:
             self.localize_check_datetime(check_datetime)
         )
 
-        if self.end_time < self.start_time and check_time < self.end_time:
-            check_start_datetime = self.tz.localize(  # type: ignore
-                datetime.combine(check_date - timedelta(days=1), self.end_time)
+        return self._get_start_end_datetimes(check_date, check_time)
+
+    def _get_start_end_datetimes(
+        self, check_date: date, check_time: time
+    ) -> Tuple[datetime, datetime]:
+        """
+        Gets the start and end datetimes for a localized date and time and returns a tuple of
+        (start_datetime, end_datetime)
+        """
+
+        if self._crosses_midnight and check_time < self.end_time:
+            check_start_datetime = self._localize(
+                datetime.combine(check_date - _ONE_DAY, self.end_time)
             )
-            check_end_datetime = self.tz.localize(  # type: ignore
+            check_end_datetime = self._localize(
                 datetime.combine(check_date, self.end_time)
             )
 
-        elif self.end_time < self.start_time and check_time > self.end_time:
-            check_start_datetime = self.tz.localize(  # type: ignore
+        elif self._crosses_midnight and check_time > self.end_time:
+            check_start_datetime = self._localize(
                 datetime.combine(check_date, self.start_time)
             )
-            check_end_datetime = self.tz.localize(  # type: ignore
-                datetime.combine(check_date + timedelta(days=1), self.end_time)
+            check_end_datetime = self._localize(
+                datetime.combine(check_date + _ONE_DAY, self.end_time)
             )
         else:
-            check_start_datetime = self.tz.localize(  # type: ignore
+            check_start_datetime = self._localize(
                 datetime.combine(check_date, self.start_time)
             )
-            check_end_datetime = self.tz.localize(  # type: ignore
+            check_end_datetime = self._localize(
                 datetime.combine(check_date, self.end_time)
             )
 
@@ -198,46 +381,29 @@ class PeriodSchedule:
         )
 
         # Valid days of the week relate to the start period, not the end period
-        has_found_valid_day_of_week = False
-
-        last_valid_date = None
-        timedelta_offset = 0
-        while not has_found_valid_day_of_week:
-            check_last_valid_date = check_date - timedelta(days=timedelta_offset)
-            check_date_day_of_week = int(check_last_valid_date.strftime("%w"))
-
-            if check_date_day_of_week in self.valid_days_of_week and not (
-                timedelta_offset == 0 and check_time < self.start_time
-            ):
-                (start_date, _) = self.get_start_end_datetimes_for_datetime(
-                    datetime.combine(
-                        check_last_valid_date, self.start_time, tzinfo=self.tz
-                    )
+        valid_date = (
+            check_date
+            - _DAY_OFFSETS[
+                self._valid_day_offset(
+                    check_date, -1, exclude_check_date=check_time < self.start_time
                 )
-                last_valid_date = start_date
-                has_found_valid_day_of_week = True
-            else:
-                # Check another day
-                timedelta_offset += 1
+            ]
+        )
+        (start_date, _) = self.get_start_end_datetimes_for_datetime(
+            datetime.combine(valid_date, self.start_time, tzinfo=self.tz)
+        )
 
-        return last_valid_date
+        return start_date
 
     def duration_since_last_start_datetime(self, check_datetime: datetime) -> timedelta:
         """
         Gets the timedelta duration between the supplied check_datetime and the last start time
         """
 
-        last_start_dt = self.get_last_start_datetime(
-            self.localize_check_datetime(check_datetime)
+        return self._duration(
+            check_datetime, self.get_last_start_datetime, "since last start", since=True
         )
 
-        if last_start_dt is None:
-            raise ValueError(
-                "Cannot get duration since last start datetime as it is null"
-            )
-
-        return self.localize_check_datetime(check_datetime) - last_start_dt
-
     def get_last_end_datetime(self, check_datetime: datetime) -> datetime:
         """
         Gets the number of seconds since the last end time
@@ -248,41 +414,28 @@ class PeriodSchedule:
         )
 
         # Valid days of the week relate to the start period, not the end period
-        has_found_valid_day_of_week = False
-
-        last_valid_date = None
-        timedelta_offset = 0
-        while not has_found_valid_day_of_week:
-            check_last_valid_date = check_date - timedelta(days=timedelta_offset)
-            check_date_day_of_week = int(check_last_valid_date.strftime("%w"))
-
-            if check_date_day_of_week in self.valid_days_of_week and not (
-                timedelta_offset == 0 and check_time < self.start_time
-            ):
-                (_, end_date) = self.get_start_end_datetimes_for_datetime(
-                    datetime.combine(
-                        check_last_valid_date, self.start_time, tzinfo=self.tz
-                    )
+        valid_date = (
+            check_date
+            - _DAY_OFFSETS[
+                self._valid_day_offset(
+                    check_date, -1, exclude_check_date=check_time < self.start_time
                 )
-                last_valid_date = end_date
-                has_found_valid_day_of_week = True
-            else:
-                # Check another day
-                timedelta_offset += 1
-
-        if last_valid_date is None:
-            raise ValueError("No valid last end datetimes found")
+            ]
+        )
+        (_, end_date) = self.get_start_end_datetimes_for_datetime(
+            datetime.combine(valid_date, self.start_time, tzinfo=self.tz)
+        )
 
-        return last_valid_date
+        return end_date
 
     def duration_since_last_end_datetime(self, check_datetime: datetime) -> timedelta:
         """
         Gets the timedelta duration between the supplied check_datetime and the last end time
         """
 
-        return self.localize_check_datetime(
-            check_datetime
-        ) - self.get_last_end_datetime(self.localize_check_datetime(check_datetime))
+        return self._duration(
+            check_datetime, self.get_last_end_datetime, "since last end", since=True
+        )
 
     def get_next_start_datetime(self, check_datetime: datetime) -> datetime | None:
         """
@@ -294,46 +447,32 @@ class PeriodSchedule:
         )
 
         # Valid days of the week relate to the start period, not the end period
-        has_found_valid_day_of_week = False
-
-        next_valid_date = None
-        timedelta_offset = 0
-        while not has_found_valid_day_of_week:
-            check_last_valid_date = check_date + timedelta(days=timedelta_offset)
-            check_date_day_of_week = int(check_last_valid_date.strftime("%w"))
-
-            if check_date_day_of_week in self.valid_days_of_week and not (
-                timedelta_offset == 0 and check_time > self.start_time
-            ):
-                (start_date, _) = self.get_start_end_datetimes_for_datetime(
-                    datetime.combine(
-                        check_last_valid_date, self.start_time, tzinfo=self.tz
-                    )
+        valid_date = (
+            check_date
+            + _DAY_OFFSETS[
+                self._valid_day_offset(
+                    check_date, 1, exclude_check_date=check_time > self.start_time
                 )
-                next_valid_date = start_date
-                has_found_valid_day_of_week = True
-            else:
-                # Check another day
-                timedelta_offset += 1
+            ]
+        )
+        (start_date, _) = self.get_start_end_datetimes_for_datetime(
+            datetime.combine(valid_date, self.start_time, tzinfo=self.tz)
+        )
 
-        return next_valid_date
+        return start_date
 
     def duration_until_next_start_datetime(self, check_datetime: datetime) -> timedelta:
         """
         Gets the timedelta duration between the supplied check_datetime and the next start time
         """
 
-        next_start_datetime = self.get_next_start_datetime(
-            self.localize_check_datetime(check_datetime)
+        return self._duration(
+            check_datetime,
+            self.get_next_start_datetime,
+            "until next start",
+            since=False,
         )
 
-        if next_start_datetime is None:
-            raise ValueError(
-                "Cannot get duration until next start datetime as it is null"
-            )
-
-        return next_start_datetime - self.localize_check_datetime(check_datetime)
-
     def get_next_end_datetime(self, check_datetime: datetime) -> datetime | None:
         """
         Gets the datetime of the next end period if there are valid days
@@ -344,46 +483,29 @@ class PeriodSchedule:
         )
 
         # Valid days of the week relate to the start period, not the end period
-        has_found_valid_day_of_week = False
-
-        next_valid_date = None
-        timedelta_offset = 0
-        while not has_found_valid_day_of_week:
-            check_last_valid_date = check_date + timedelta(days=timedelta_offset)
-            check_date_day_of_week = int(check_last_valid_date.strftime("%w"))
-
-            if check_date_day_of_week in self.valid_days_of_week and not (
-                timedelta_offset == 0 and check_time > self.start_time
-            ):
-                (_, end_date) = self.get_start_end_datetimes_for_datetime(
-                    datetime.combine(
-                        check_last_valid_date, self.start_time, tzinfo=self.tz
-                    )
+        valid_date = (
+            check_date
+            + _DAY_OFFSETS[
+                self._valid_day_offset(
+                    check_date, 1, exclude_check_date=check_time > self.start_time
                 )
-                next_valid_date = end_date
-                has_found_valid_day_of_week = True
-            else:
-                # Check another day
-                timedelta_offset += 1
+            ]
+        )
+        (_, end_date) = self.get_start_end_datetimes_for_datetime(
+            datetime.combine(valid_date, self.start_time, tzinfo=self.tz)
+        )
 
-        return next_valid_date
+        return end_date
 
     def duration_until_next_end_datetime(self, check_datetime: datetime) -> timedelta:
         """
         Gets the timedelta duration between the supplied check_datetime and the next end time
         """
 
-        next_end_datetime = self.get_next_end_datetime(
-            self.localize_check_datetime(check_datetime)
+        return self._duration(
+            check_datetime, self.get_next_end_datetime, "until next end", since=False
         )
 
-        if next_end_datetime is None:
-            raise ValueError(
-                "Cannot get duration until next end datetime as it is null"
-            )
-
-        return next_end_datetime - self.localize_check_datetime(check_datetime)
-
     def get_current_start_datetime(self, check_datetime: datetime) -> datetime | None:
         """
         Gets the datetime of the current end period if there it is a valid day
@@ -394,28 +516,12 @@ class PeriodSchedule:
         )
 
         # Valid days of the week relate to the start period, not the end period
-        has_found_valid_day_of_week = False
-
-        next_valid_date = None
-        timedelta_offset = 0
-
-        while not has_found_valid_day_of_week:
-            check_last_valid_date = check_date + timedelta(days=timedelta_offset)
-            check_date_day_of_week = int(check_last_valid_date.strftime("%w"))
-
-            if check_date_day_of_week in self.valid_days_of_week:
-                (start_date, _) = self.get_start_end_datetimes_for_datetime(
-                    datetime.combine(
-                        check_last_valid_date, self.start_time, tzinfo=self.tz
-                    )
-                )
-                next_valid_date = start_date
-                has_found_valid_day_of_week = True
-            else:
-                # Check another day
-                timedelta_offset += 1
+        valid_date = check_date + _DAY_OFFSETS[self._valid_day_offset(check_date, 1)]
+        (start_date, _) = self.get_start_end_datetimes_for_datetime(
+            datetime.combine(valid_date, self.start_time, tzinfo=self.tz)
+        )
 
-        return next_valid_date
+        return start_date
 
     def duration_until_current_start_datetime(
         self, check_datetime: datetime
@@ -424,17 +530,13 @@ class PeriodSchedule:
         Gets the timedelta duration between the supplied check_datetime and the next end time
         """
 
-        current_start_datetime = self.get_current_start_datetime(
-            self.localize_check_datetime(check_datetime)
+        return self._duration(
+            check_datetime,
+            self.get_current_start_datetime,
+            "until current start",
+            since=False,
         )
 
-        if current_start_datetime is None:
-            raise ValueError(
-                "Cannot get duration until current start datetime as it is null"
-            )
-
-        return current_start_datetime - self.localize_check_datetime(check_datetime)
-
     def get_current_end_datetime(self, check_datetime: datetime) -> datetime | None:
         """
         Gets the datetime of the current end period if there it is a valid day
@@ -445,28 +547,12 @@ class PeriodSchedule:
         )
 
         # Valid days of the week relate to the start period, not the end period
-        has_found_valid_day_of_week = False
-
-        next_valid_date = None
-        timedelta_offset = 0
-
-        while not has_found_valid_day_of_week:
-            check_last_valid_date = check_date + timedelta(days=timedelta_offset)
-            check_date_day_of_week = int(check_last_valid_date.strftime("%w"))
-
-            if check_date_day_of_week in self.valid_days_of_week:
-                (_, end_date) = self.get_start_end_datetimes_for_datetime(
-                    datetime.combine(
-                        check_last_valid_date, self.start_time, tzinfo=self.tz
-                    )
-                )
-                next_valid_date = end_date
-                has_found_valid_day_of_week = True
-            else:
-                # Check another day
-                timedelta_offset += 1
+        valid_date = check_date + _DAY_OFFSETS[self._valid_day_offset(check_date, 1)]
+        (_, end_date) = self.get_start_end_datetimes_for_datetime(
+            datetime.combine(valid_date, self.start_time, tzinfo=self.tz)
+        )
 
-        return next_valid_date
+        return end_date
 
     def duration_until_current_end_datetime(
         self, check_datetime: datetime
@@ -475,13 +561,9 @@ class PeriodSchedule:
         Gets the timedelta duration between the supplied check_datetime and the next end time
         """
 
-        current_end_datetime = self.get_current_end_datetime(
-            self.localize_check_datetime(check_datetime)
+        return self._duration(
+            check_datetime,
+            self.get_current_end_datetime,
+            "until current end",
+            since=False,
         )
-
-        if current_end_datetime is None:
-            raise ValueError(
-                "Cannot get duration until current end datetime as it is null"
-            )
-
-        return current_end_datetime - self.localize_check_datetime(check_datetime)
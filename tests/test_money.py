@@ -0,0 +1,214 @@
+import math
+from decimal import Decimal
+
+import pytest
+
+from src.dpn_pyutils.money import (
+    _format_currency_market_display_float,
+    format_currency_market_display_bytes,
+    format_currency_market_display_float,
+    make_currency_formatter,
+)
+
+MICRO_VALUES = (
+    (0.0000005, "<$0.000001"),
+    (0.000001, "<$0.000001"),
+    (-0.0000005, "<-$0.000001"),
+    (-0.000001, "<-$0.000001"),
+)
+
+SMALL_FRACTION_VALUES = (
+    (0.000010, "$0.00001"),
+    (0.000690, "$0.00069"),
+    (0.002895, "$0.002895"),
+    (0.01, "$0.01"),
+    (-0.000690, "-$0.00069"),
+)
+
+CENTS_VALUES = (
+    (0.05, "$0.05"),
+    (0.5, "$0.50"),
+    (0.99, "$0.99"),
+    (-0.5, "-$0.50"),
+)
+
+DOLLAR_VALUES = (
+    (0.0, "$0.00"),
+    (-0.0, "$0.00"),
+    (1.0, "$1.00"),
+    (12.345, "$12.35"),
+    (999.99, "$999.99"),
+    (-12.5, "-$12.50"),
+)
+
+SUMMARY_SUFFIX_VALUES = (
+    (1000, "$1.00k"),
+    (1234.5, "$1.23k"),
+    (2500000.0, "$2.5M"),
+    (3210000000.0, "$3.2B"),
+    (4560000000000.0, "$4.6T"),
+    (-2500000.0, "-$2.5M"),
+)
+
+BOUNDARY_VALUES = (
+    (0.0099999, "$0.01"),
+    (0.999, "$1.00"),
+    (1.00999, "$1.01"),
+    (999.99999, "$1000.00"),
+    (1e6, "$1.0M"),
+    (1e9, "$1.0B"),
+    (1e12, "$1.0T"),
+)
+
+# The closest floats either side of each band threshold, as well as the threshold itself
+BAND_THRESHOLD_VALUES = (
+    (math.nextafter(1e-6, 0), "<$0.000001"),
+    (1e-6, "<$0.000001"),
+    (math.nextafter(1e-6, math.inf), "$0.000001"),
+    (math.nextafter(1e3, 0), "$1000.00"),
+    (1e3, "$1.00k"),
+    (math.nextafter(1e6, 0), "$1000.00k"),
+    (1e6, "$1.0M"),
+    (math.nextafter(1e9, 0), "$1000.0M"),
+    (1e9, "$1.0B"),
+    (math.nextafter(1e12, 0), "$1000.0B"),
+    (1e12, "$1.0T"),
+)
+
+# Values are rounded from their exact binary representation, and exact ties round to even
+ROUNDING_VALUES = (
+    (0.125, "$0.12"),
+    (0.375, "$0.38"),
+    (1.005, "$1.00"),
+    (2.675, "$2.67"),
+    (2.5, "$2.50"),
+)
+
+# Sub-cent values whose repr() uses scientific notation, or whose fixed-point digits end in zeroes
+SUB_CENT_NOTATION_VALUES = (
+    (5e-06, "$0.000005"),
+    (1.5e-05, "$0.000015"),
+    (9.9e-05, "$0.000099"),
+    (-5e-06, "-$0.000005"),
+    (0.0001, "$0.0001"),
+    (0.0012, "$0.0012"),
+    (0.0099999999, "$0.01"),
+)
+
+# Sub-cent values are rounded from their exact binary representation, so decimal half-way values
+# round to whichever side the float actually lies on
+SUB_CENT_TIE_VALUES = (
+    (0.0000025, "$0.000003"),
+    (0.0000045, "$0.000005"),
+    (0.0000195, "$0.000019"),
+    (-0.0000025, "-$0.000003"),
+    (-0.0000195, "-$0.000019"),
+)
+
+PRECISION_EDGE_VALUES = (
+    (0.0000010000001, "$0.000001"),
+    (0.010001, "$0.01"),
+)
+
+
+class TestCurrencyFormatting:
+    @pytest.mark.parametrize(
+        "value, expected",
+        MICRO_VALUES
+        + SMALL_FRACTION_VALUES
+        + CENTS_VALUES
+        + DOLLAR_VALUES
+        + SUMMARY_SUFFIX_VALUES
+        + BOUNDARY_VALUES
+        + BAND_THRESHOLD_VALUES
+        + ROUNDING_VALUES
+        + SUB_CENT_NOTATION_VALUES
+        + SUB_CENT_TIE_VALUES
+        + PRECISION_EDGE_VALUES,
+    )
+    def test_format_currency_market_display_float(self, value, expected):
+        assert format_currency_market_display_float(value) == expected
+
+    @pytest.mark.parametrize(
+        "value, currency_symbol, expected",
+        [
+            (12.5, "€", "€12.50"),
+            (-0.000690, "£", "-£0.00069"),
+            (0.0000005, "¥", "<¥0.000001"),
+        ],
+    )
+    def test_custom_currency_symbol(self, value, currency_symbol, expected):
+        assert format_currency_market_display_float(value, currency_symbol) == expected
+
+    @pytest.mark.parametrize(
+        "value, suffix, expected",
+        [
+            (12.5, " USD", "$12.50 USD"),
+            (2500000.0, " AUD", "$2.5M AUD"),
+            (-0.0000005, " USD", "<-$0.000001 USD"),
+        ],
+    )
+    def test_custom_suffix(self, value, suffix, expected):
+        assert format_currency_market_display_float(value, suffix=suffix) == expected
+
+    def test_repeated_values_are_cached(self):
+        _format_currency_market_display_float.cache_clear()
+        format_currency_market_display_float(100.25)
+        format_currency_market_display_float(100.25)
+
+        assert _format_currency_market_display_float.cache_info().hits == 1
+
+    def test_negative_zero_does_not_share_cached_value(self):
+        _format_currency_market_display_float.cache_clear()
+
+        assert format_currency_market_display_float(-0.0) == "$0.00"
+        assert format_currency_market_display_float(0.0) == "$0.00"
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (Decimal("12.5"), "$12.50"),
+            (Decimal("-12.5"), "-$12.50"),
+            (Decimal("0.0005"), "$0.0005"),
+            (Decimal("-0"), "$0.00"),
+        ],
+    )
+    def test_decimal_values(self, value, expected):
+        assert format_currency_market_display_float(value) == expected
+        assert format_currency_market_display_bytes(value) == expected.encode("utf-8")
+
+    @pytest.mark.parametrize(
+        "value, currency_symbol, suffix, expected",
+        [
+            (12.5, "$", "", b"$12.50"),
+            (-0.0, "$", "", b"$0.00"),
+            (-2500000.0, "€", " EUR", "-€2.5M EUR".encode("utf-8")),
+        ],
+    )
+    def test_format_currency_market_display_bytes(
+        self, value, currency_symbol, suffix, expected
+    ):
+        assert (
+            format_currency_market_display_bytes(value, currency_symbol, suffix)
+            == expected
+        )
+
+    @pytest.mark.parametrize(
+        "value, currency_symbol, suffix, expected",
+        [
+            (-0.000690, "€", " EUR", "-€0.00069 EUR"),
+            (0.0000005, "€", " EUR", "<€0.000001 EUR"),
+            (1234.5, "'\\", '"', "'\\1.23k\""),
+            (-12.5, "{", "}", "-{12.50}"),
+            (float("inf"), "$", "", "$infT"),
+            (float("-inf"), "$", "", "-$infT"),
+            (-0.0, "$", "", "$0.00"),
+        ],
+    )
+    def test_make_currency_formatter(self, value, currency_symbol, suffix, expected):
+        format_currency = make_currency_formatter(currency_symbol, suffix)
+
+        assert format_currency(value) == expected
+
+    def test_make_currency_formatter_is_cached(self):
+        assert make_currency_formatter("€") is make_currency_formatter("€")